@@ -8,22 +8,28 @@ and automatically disables unused rules that meet specific criteria.
 Author: Artur Pinto (arturj.pinto@gmail.com)
 """
 
+from __future__ import annotations
+
 import argparse
+import atexit
+import csv
 import datetime
 import ipaddress
+import json
 import logging
+import math
+import os
+import random
+import re
 import sys
+import tempfile
+import threading
 import time
-from typing import Dict, List, Optional, Set, Union
-
-try:
-    import openpyxl
-    from openpyxl.styles import Font, Alignment, PatternFill
-    from openpyxl.utils import get_column_letter
-    EXCEL_AVAILABLE = True
-except ImportError:
-    EXCEL_AVAILABLE = False
-    logging.warning("openpyxl not installed. Excel export functionality will be disabled.")
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 try:
     import fmcapi
@@ -31,9 +37,208 @@ try:
 except ImportError:
     fmcapi = None
 
+# Optional faster JSON decoder for FMC API responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# openpyxl is imported on first use so runs without an Excel report don't pay for it
+_openpyxl = None
+_openpyxl_checked = False
+
+
+def _try_import_openpyxl():
+    """
+    Import openpyxl on first use.
+    
+    Returns:
+        The openpyxl module, or None if it is not installed
+    """
+    global _openpyxl, _openpyxl_checked
+    if not _openpyxl_checked:
+        _openpyxl_checked = True
+        try:
+            import openpyxl
+            _openpyxl = openpyxl
+        except ImportError:
+            _openpyxl = None
+    return _openpyxl
+
+
+# Worker threads used to fetch network objects concurrently. Kept small so the
+# FMC API rate limit is not exceeded.
+RESOLVER_MAX_WORKERS = 4
+# Listing Networks, Hosts and NetworkGroups takes at least one request per type, so
+# up to this many uncached objects are cheaper to fetch one by one
+PREFETCH_MIN_UNCACHED_OBJECTS = 3
+# Worker threads used to fetch zero-hit rules concurrently before they are processed.
+# The pool is sized from the API rate limit: more workers than the rate times the
+# typical latency of one rule GET would only queue on the rate limiter
+RULE_FETCH_MAX_WORKERS = 8
+RULE_FETCH_EXPECTED_LATENCY = 1.0  # Seconds
+# Exponential backoff with jitter for rule fetches that hit a connection timeout
+RULE_FETCH_MAX_RETRIES = 4
+RETRY_BACKOFF_BASE = 2  # Seconds; delay doubles per attempt, plus up to this much jitter
+RETRY_BACKOFF_CAP = 120  # Maximum delay in seconds before jitter
+# Number of rules disabled per bulk PUT request
+BULK_DISABLE_CHUNK_SIZE = 100
+# Backoff delays (seconds) for bulk PUT requests that time out
+BULK_DISABLE_RETRY_DELAYS = [10, 20, 30]
+# Hours a network object persisted with --cache-file is trusted without asking FMC again
+DEFAULT_CACHE_TTL_HOURS = 24
+
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    Compute the exponential backoff delay (with jitter) before a retry.
+    
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        
+    Returns:
+        Delay in seconds
+    """
+    delay = min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * (2 ** attempt))
+    return delay + random.uniform(0, RETRY_BACKOFF_BASE)
+
+
+# Client-side pacing of per-object and per-rule API calls. FMC allows 120 requests
+# per minute, so the default stays just under 2 requests per second.
+DEFAULT_API_RATE_LIMIT = 1.8
+API_RATE_BURST = 10
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace FMC API calls."""
+    
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            rate: Tokens added per second (0 or less disables rate limiting)
+            burst: Maximum number of tokens that can accumulate
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a token is available and consume it."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Connections kept open to the FMC; sized for the resolver and rule fetch pools
+HTTP_POOL_SIZE = RESOLVER_MAX_WORKERS + RULE_FETCH_MAX_WORKERS
+
+
+class _PooledRequests:
+    """
+    Stand-in for the requests module inside fmcapi that sends calls through one Session.
+    
+    fmcapi calls requests.get/post/put/delete directly, which opens a new TCP and TLS
+    connection for every API call. Routing them through a shared Session keeps the
+    connections to the FMC alive between calls. Everything else (exceptions, auth,
+    packages) is looked up on the real requests module.
+    """
+    
+    def __init__(self, pool_size: int):
+        """
+        Initialize the pooled session.
+        
+        Args:
+            pool_size: Maximum number of connections kept open to the FMC
+        """
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self.get = self._session.get
+        self.post = self._session.post
+        self.put = self._session.put
+        self.delete = self._session.delete
+        atexit.register(self._session.close)
+    
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def _use_pooled_transport() -> None:
+    """Make fmcapi send its API calls through a shared keep-alive session (once per process)."""
+    fmc_module = sys.modules.get("fmcapi.fmc")
+    if fmc_module is not None and not isinstance(fmc_module.requests, _PooledRequests):
+        fmc_module.requests = _PooledRequests(HTTP_POOL_SIZE)
+
+
+def _serialize_token_refresh(fmc_client) -> None:
+    """
+    Make the FMC client's token refresh safe to call from several threads.
+    
+    fmcapi's Token.get_token() clears access_token before generating a new one, so a
+    thread sending a request during the refresh would go out without a token and get
+    HTTP 401. Refreshes are serialized with a lock so every caller gets a valid token.
+    
+    Args:
+        fmc_client: FMC API client instance
+    """
+    token = getattr(fmc_client, "mytoken", None)
+    if token is None or getattr(token, "_refresh_lock", None) is not None:
+        return
+    refresh_lock = threading.Lock()
+    get_token = token.get_token
+    
+    def locked_get_token():
+        with refresh_lock:
+            return get_token()
+    
+    token._refresh_lock = refresh_lock
+    token.get_token = locked_get_token
+
+
+class _FastJSON:
+    """
+    Stand-in for the json module inside fmcapi that decodes API responses with orjson.
+    
+    Rule and object payloads can be several KB each, and orjson parses them several
+    times faster than the standard library. Everything else is looked up on json.
+    """
+    
+    loads = staticmethod(orjson.loads) if orjson is not None else None
+    
+    def __getattr__(self, name):
+        return getattr(json, name)
+
+
+def _use_fast_json_decoder() -> None:
+    """Make fmcapi decode API responses with orjson when it is installed (once per process)."""
+    fmc_module = sys.modules.get("fmcapi.fmc")
+    if orjson is not None and fmc_module is not None and not isinstance(fmc_module.json, _FastJSON):
+        fmc_module.json = _FastJSON()
+
 
 # Progress bar function for console output
-def print_progress_bar(iteration, total, prefix='', suffix='', length=50, fill='█', print_end="\r"):
+PROGRESS_REDRAW_INTERVAL = 0.25  # Minimum seconds between progress bar redraws
+_last_draw_time = 0.0
+_last_output = ""  # Last progress bar frame written, to skip identical redraws
+
+
+def print_progress_bar(iteration, total, prefix='', suffix='', length=50, fill='█', print_end="\r",
+                       force=False):
     """
     Call in a loop to create a terminal progress bar
     @params:
@@ -44,25 +249,254 @@ def print_progress_bar(iteration, total, prefix='', suffix='', length=50, fill='
         length      - Optional  : character length of bar (Int)
         fill        - Optional  : bar fill character (Str)
         print_end   - Optional  : end character (e.g. "\r", "\n") (Str)
+        force       - Optional  : redraw even if the bar was drawn very recently (Bool)
     """
-    # Clear any previous text in the line first (using 120 spaces to ensure full line clearing)
-    print("\r" + " " * 120, end="\r")
+    global _last_draw_time, _last_output
+    
+    # Throttle redraws; the final iteration is always drawn
+    now = time.monotonic()
+    if not force and iteration < total and now - _last_draw_time < PROGRESS_REDRAW_INTERVAL:
+        return
+    _last_draw_time = now
     
     # Calculate percentage and create bar
     percent = ("{0:.1f}").format(100 * (iteration / float(total)))
     filled_length = int(length * iteration // total)
     bar = fill * filled_length + '-' * (length - filled_length)
     
-    # Format text with counter, percentage and any extra info
+    # Format text with counter, percentage and any extra info.
+    # "\x1b[2K" erases the previous line contents before redrawing
     status = f"{iteration}/{total}"
-    output = f'\r{prefix} |{bar}| {percent}% {status} {suffix}'
-    
-    # Print the formatted progress bar
-    print(output, end=print_end)
+    output = f'\r\x1b[2K{prefix} |{bar}| {percent}% {status} {suffix}{print_end}'
     
     # Print a new line if we're at the end
     if iteration >= total:
-        print()
+        output += "\n"
+    
+    # Skip the write if the frame is identical to what is already on screen
+    if output == _last_output and not force:
+        return
+    _last_output = output
+    
+    sys.stdout.write(output)
+    sys.stdout.flush()
+
+
+# Tag written at the start of the comment added to every rule this script disables
+_SCRIPT_TAG = "DisabledByHitCountScript"
+# Year at the start of an FMC comment date (e.g., 2023-01-31T10:00:00Z)
+_YEAR_RE = re.compile(r"^(\d{4})-")
+
+
+@lru_cache(maxsize=256)
+def _year_prefix(date_prefix: str) -> Optional[int]:
+    """
+    Parse the year from the first five characters of an FMC comment date.
+    
+    Only a handful of distinct years occur across a policy, so keying the cache on
+    the "YYYY-" prefix rather than the full timestamp keeps it tiny.
+    
+    Args:
+        date_prefix: First five characters of the date (e.g., "2023-")
+        
+    Returns:
+        The year, or None if the prefix is not a year followed by '-'
+    """
+    match = _YEAR_RE.match(date_prefix)
+    return int(match.group(1)) if match else None
+
+
+def _year_of(date_str: str) -> Optional[int]:
+    """
+    Get the year of an FMC comment date (e.g., 2023-01-31T10:00:00Z).
+    
+    Args:
+        date_str: Comment date string
+        
+    Returns:
+        The year, or None if the date does not start with a year
+    """
+    return _year_prefix(date_str[:5])
+
+
+# Names of FMC's built-in "any" network objects and the IP versions they cover
+_ANY_NETWORK_VERSIONS = {"any": (4, 6), "any-ipv4": (4,), "any-ipv6": (6,)}
+
+
+class _RuleFeatures(NamedTuple):
+    """Fields of an access rule used by the disable decision, extracted in one pass."""
+    name: str
+    enabled: bool
+    action: str
+    zone_names: Tuple[str, ...]
+    networks: Dict[str, Dict]  # sourceNetworks/destinationNetworks entries present on the rule
+    has_comment_history: bool
+    first_comment_text: str
+    first_comment_date: str
+
+
+# IP prefix matching helpers (module level so results can be memoized across rules)
+@lru_cache(maxsize=None)
+def _build_prefix_tries(prefixes: Tuple[Tuple[int, int, int], ...]) -> Dict[int, Dict]:
+    """
+    Build binary tries of excluded prefixes, one per IP version.
+    
+    Each trie level is keyed by the next high-order bit (0 or 1) of the network
+    address; the node reached after prefixlen bits stores the network itself.
+    
+    Args:
+        prefixes: Tuple of (network_int, prefixlen, version) entries
+        
+    Returns:
+        Dictionary mapping IP version (4 or 6) to the root node of its trie
+    """
+    tries: Dict[int, Dict] = {4: {}, 6: {}}
+    for base, prefixlen, version in prefixes:
+        bits = 32 if version == 4 else 128
+        node = tries[version]
+        for depth in range(prefixlen):
+            node = node.setdefault((base >> (bits - 1 - depth)) & 1, {})
+        network_class = ipaddress.IPv4Network if version == 4 else ipaddress.IPv6Network
+        node["prefix"] = network_class((base, prefixlen))
+    return tries
+
+
+def _trie_overlaps(trie: Dict, start_int: int, end_int: int, version: int,
+                   mode: str) -> Optional[Union[ipaddress.IPv4Network, ipaddress.IPv6Network]]:
+    """
+    Find an excluded prefix matching the integer address range [start_int, end_int].
+    
+    In 'overlap' mode any excluded prefix intersecting the range matches. In 'subnet'
+    mode the range must be fully contained within a single excluded prefix.
+    
+    Args:
+        trie: Root node of the trie for the given IP version
+        start_int: First address of the range as an integer
+        end_int: Last address of the range as an integer
+        version: IP version (4 or 6)
+        mode: Prefix match mode ('overlap' or 'subnet')
+        
+    Returns:
+        The matching excluded prefix, or None if there is no match
+    """
+    node = trie
+    bits = 32 if version == 4 else 128
+    
+    if mode == 'subnet':
+        # Only prefixes along the common leading bits of start and end can contain the range
+        for depth in range(bits + 1):
+            if "prefix" in node:
+                return node["prefix"]
+            if depth == bits:
+                break
+            shift = bits - 1 - depth
+            bit = (start_int >> shift) & 1
+            if bit != (end_int >> shift) & 1 or bit not in node:
+                break
+            node = node[bit]
+        return None
+    
+    # Overlap mode: depth-first walk pruning subtrees whose span misses the range
+    stack = [(node, 0, 0)]
+    while stack:
+        node, base, depth = stack.pop()
+        span_end = base + (1 << (bits - depth)) - 1
+        if span_end < start_int or base > end_int:
+            continue
+        if "prefix" in node:
+            return node["prefix"]
+        if base >= start_int and span_end <= end_int:
+            # Subtree lies entirely within the range, so any prefix below it matches
+            while node and "prefix" not in node:
+                node = node[0] if 0 in node else node[1]
+            if "prefix" in node:
+                return node["prefix"]
+            continue
+        for bit in (0, 1):
+            if bit in node:
+                stack.append((node[bit], base | (bit << (bits - 1 - depth)), depth + 1))
+    return None
+
+
+def _parse_ip_range(ip_range: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse IP range notation (e.g., 10.1.1.1-10.1.1.10) into integer bounds.
+    
+    Args:
+        ip_range: IP range in format "start_ip-end_ip"
+        
+    Returns:
+        Tuple of (start_int, end_int, version), or None if invalid
+    """
+    try:
+        if '-' not in ip_range:
+            start_ip = end_ip = ipaddress.ip_address(ip_range.strip())
+        else:
+            start_ip_str, end_ip_str = ip_range.split('-', 1)
+            start_ip = ipaddress.ip_address(start_ip_str.strip())
+            end_ip = ipaddress.ip_address(end_ip_str.strip())
+        
+        if start_ip.version != end_ip.version:
+            raise ValueError("start and end addresses are of different IP versions")
+        if int(start_ip) > int(end_ip):
+            raise ValueError("start address is greater than end address")
+        
+        return int(start_ip), int(end_ip), start_ip.version
+        
+    except Exception as e:
+        logging.warning("Failed to parse IP range '%s': %s", ip_range, e)
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _parse_network_int(ip_or_network: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse an IP address, CIDR network or IP range into integer bounds.
+    
+    Args:
+        ip_or_network: IP address, network in CIDR notation, or IP range
+        
+    Returns:
+        Tuple of (start_int, end_int, version), or None if invalid
+    """
+    # Check if it's an IP range (contains '-')
+    if '-' in ip_or_network:
+        return _parse_ip_range(ip_or_network)
+    
+    # Handle CIDR notation or single IP
+    try:
+        network = ipaddress.ip_network(ip_or_network, strict=False)
+    except ValueError as e:
+        logging.warning("Invalid IP/network '%s': %s", ip_or_network, e)
+        return None
+    return int(network.network_address), int(network.broadcast_address), network.version
+
+
+@lru_cache(maxsize=8192)
+def _overlaps_cached(
+    ip_or_network: str, mode: str, prefixes: Tuple[Tuple[int, int, int], ...]
+) -> Optional[Union[ipaddress.IPv4Network, ipaddress.IPv6Network]]:
+    """
+    Find the excluded prefix, if any, that an IP address, network or range matches.
+    
+    Args:
+        ip_or_network: IP address, network in CIDR notation, or IP range
+        mode: Prefix match mode ('overlap' or 'subnet')
+        prefixes: Tuple of (network_int, prefixlen, version) excluded prefixes
+        
+    Returns:
+        The matching excluded prefix, or None if the value matches none of them
+    """
+    parsed = _parse_network_int(ip_or_network)
+    if parsed is None:
+        return None  # Invalid value, can't determine overlap
+    start_int, end_int, version = parsed
+    
+    trie = _build_prefix_tries(prefixes)[version]
+    if not trie:
+        return None  # No excluded prefixes of this IP version
+    
+    return _trie_overlaps(trie, start_int, end_int, version, mode)
 
 
 class FMCRuleManager:
@@ -74,7 +508,9 @@ class FMCRuleManager:
                  max_rules_to_disable: int = 1000, dry_run: bool = False,
                  exclude_zones: Optional[List[str]] = None, year_threshold: int = None,
                  rule_actions: Optional[List[str]] = None, exclude_prefixes: Optional[List[str]] = None,
-                 prefix_match_mode: str = 'overlap'):
+                 prefix_match_mode: str = 'overlap', cache_file: Optional[str] = None,
+                 refresh_cache: bool = False, api_rate_limit: float = DEFAULT_API_RATE_LIMIT,
+                 cache_ttl_hours: float = DEFAULT_CACHE_TTL_HOURS):
         """
         Initialize FMC Rule Manager.
         
@@ -95,6 +531,10 @@ class FMCRuleManager:
             rule_actions: List of rule actions to consider (ALLOW, BLOCK, or both)
             exclude_prefixes: List of IP prefixes (CIDR) to exclude from rule processing
             prefix_match_mode: Mode for prefix matching - 'overlap' (any overlap) or 'subnet' (subset only)
+            cache_file: JSON file used to persist resolved network objects across runs (optional)
+            refresh_cache: If True, ignore any existing cache file contents and rebuild it
+            api_rate_limit: Maximum object/rule API calls per second (0 disables rate limiting)
+            cache_ttl_hours: Age in hours after which cache file entries are discarded
         """
         self.host = host
         self.username = username
@@ -107,11 +547,17 @@ class FMCRuleManager:
         self.log_file = log_file
         self.max_rules_to_disable = max_rules_to_disable
         self.dry_run = dry_run
-        self.exclude_zones = exclude_zones or []
+        # Frozen set for O(1) zone membership checks
+        self.exclude_zones = frozenset(exclude_zones or ())
         # Set default year threshold to previous year if not specified
         self.year_threshold = year_threshold if year_threshold is not None else datetime.datetime.now().year - 1
         self.rule_actions = rule_actions or ['ALLOW']
+        # Interned frozen set for the per-rule action check; the list above is kept for messages
+        self._rule_action_set = frozenset(map(sys.intern, self.rule_actions))
         self.prefix_match_mode = prefix_match_mode
+        self.cache_file = os.path.expanduser(cache_file) if cache_file else None
+        self.refresh_cache = refresh_cache
+        self.cache_ttl = cache_ttl_hours * 3600
         
         # Parse and validate exclude prefixes
         self.exclude_prefixes: List[Union[ipaddress.IPv4Network, ipaddress.IPv6Network]] = []
@@ -124,16 +570,52 @@ class FMCRuleManager:
                 except ValueError as e:
                     logging.warning(f"Invalid IP prefix '{prefix}': {e}. Skipping.")
         
+        # Hashable (network_int, prefixlen, version) form of the excluded prefixes,
+        # used as the cache key for the memoized overlap checks
+        self._exclude_prefixes_key: Tuple[Tuple[int, int, int], ...] = tuple(
+            (int(network.network_address), network.prefixlen, network.version)
+            for network in self.exclude_prefixes
+        )
+        self._exclude_prefix_versions = frozenset(
+            network.version for network in self.exclude_prefixes
+        )
+        
         # Cache for resolved network objects to avoid repeated API calls
         self._network_object_cache: Dict[str, List[str]] = {}
+        # When entries loaded from the cache file were resolved (epoch seconds); entries
+        # resolved during this run are stamped when the cache file is saved
+        self._cache_resolved_at: Dict[str, float] = {}
+        # In-memory index of prefetched network objects: id -> (type, raw object data)
+        self._obj_by_id: Dict[str, Tuple[str, Dict]] = {}
+        # Guards _network_object_cache writes from the resolver threads
+        self._cache_lock = threading.Lock()
+        self._resolver_pool = ThreadPoolExecutor(max_workers=RESOLVER_MAX_WORKERS,
+                                                 thread_name_prefix="resolver")
+        # Paces object lookups and rule GET/PUT calls so FMC doesn't answer with HTTP 429
+        self._limiter = TokenBucket(api_rate_limit, API_RATE_BURST)
+        # Set when FMC rejects a bulk disable request; later batches use per-rule PUTs
+        self._bulk_put_rejected = False
+        if api_rate_limit > 0:
+            expected_in_flight = math.ceil(api_rate_limit * RULE_FETCH_EXPECTED_LATENCY)
+            self._rule_fetch_workers = max(1, min(RULE_FETCH_MAX_WORKERS, expected_in_flight))
+        else:
+            self._rule_fetch_workers = RULE_FETCH_MAX_WORKERS
         
         # Check if fmcapi is available
         if fmcapi is None:
             raise ImportError("fmcapi module is required. Install with: pip install fmcapi")
+        _use_pooled_transport()
+        _use_fast_json_decoder()
         
         # Setup logging
         self._setup_logging()
         
+        # Load resolved network objects persisted by previous runs and save them on exit
+        if self.cache_file:
+            if not self.refresh_cache:
+                self._load_network_object_cache()
+            atexit.register(self._save_network_object_cache)
+        
     def _setup_logging(self) -> None:
         """Configure logging to go to file only, not to console."""
         log_level = logging.DEBUG if self.debug else logging.INFO
@@ -154,184 +636,387 @@ class FMCRuleManager:
             # No log file specified, use minimal console logging
             logging.basicConfig(level=log_level)
             
-    def _resolve_network_object(self, fmc_client, obj_id: str, obj_type: str, 
-                                visited: Optional[Set[str]] = None) -> List[str]:
+    def _read_network_object_cache_file(self) -> Dict:
         """
-        Resolve a network object/group to its constituent IP addresses/networks.
-        Handles nested groups recursively with circular reference protection.
+        Read the whole cache file, shared by all FMC hosts.
+        
+        Returns:
+            The cache file contents, or an empty dict if the file is missing,
+            unreadable or does not hold a JSON object
+        """
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read network object cache '{self.cache_file}': {e}")
+            return {}
+        if not isinstance(data, dict):
+            logging.warning(f"Ignoring network object cache '{self.cache_file}': "
+                            f"it does not hold a JSON object")
+            return {}
+        return data
+    
+    def _load_network_object_cache(self) -> None:
+        """
+        Seed the network object cache with entries for this FMC host from the cache file.
+        
+        Entries older than the cache TTL are dropped, so an object changed in FMC is
+        fetched again instead of being checked against stale addresses.
+        """
+        cached = self._read_network_object_cache_file().get(self.host)
+        if not isinstance(cached, dict):
+            return
+        oldest = time.time() - self.cache_ttl
+        expired = 0
+        for obj_id, entry in cached.items():
+            # Skip malformed entries (or ones written by older versions) rather than
+            # handing them to the prefix checks
+            if not isinstance(entry, dict):
+                continue
+            resolved_at = entry.get("resolved_at")
+            networks = entry.get("networks")
+            if (not isinstance(resolved_at, (int, float)) or not isinstance(networks, list)
+                    or not all(isinstance(value, str) for value in networks)):
+                continue
+            if resolved_at < oldest:
+                expired += 1
+                continue
+            self._network_object_cache[obj_id] = networks
+            self._cache_resolved_at[obj_id] = resolved_at
+        logging.info(f"Loaded {len(self._cache_resolved_at)} cached network objects from "
+                     f"{self.cache_file} ({expired} expired)")
+    
+    def _save_network_object_cache(self) -> None:
+        """Write this FMC host's network object cache back to the cache file."""
+        cached = self._read_network_object_cache_file()
+        
+        # Entries are keyed by FMC host so several FMCs can share one cache file
+        now = time.time()
+        cached[self.host] = {
+            obj_id: {"resolved_at": self._cache_resolved_at.get(obj_id, now), "networks": networks}
+            for obj_id, networks in self._network_object_cache.items()
+        }
+        # Write to a temporary file in the same directory and move it into place, so a
+        # crash or an overlapping run never leaves a truncated cache file behind
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix=".fmc_rule_cleanup_cache.",
+                                            dir=os.path.dirname(os.path.abspath(self.cache_file)))
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cached, f)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            logging.warning(f"Could not write network object cache '{self.cache_file}': {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        logging.info(f"Saved {len(self._network_object_cache)} network objects "
+                     f"to {self.cache_file}")
+    
+    def _prefetch_object_index(self, fmc_client) -> None:
+        """
+        Fetch all Networks, Hosts and NetworkGroups in bulk and index them by ID.
+        
+        Listing each object type once (fmcapi follows the paging links) replaces one
+        GET per referenced object during prefix resolution. Simple Network/Host
+        objects are also seeded straight into the network object cache. Only called
+        when the rules reference more objects than the cache can answer. With a cache
+        file, every group is expanded from the index as well, so the next run finds
+        the groups it needs in the cache instead of listing everything again.
         
         Args:
             fmc_client: FMC API client instance
-            obj_id: Object ID to resolve
-            obj_type: Object type (Network, NetworkGroup, Host, etc.)
-            visited: Set of visited IDs to prevent circular references
-            
-        Returns:
-            List of IP addresses/networks in CIDR notation
         """
-        if visited is None:
-            visited = set()
+        object_classes = [
+            ("Network", fmcapi.Networks),
+            ("Host", fmcapi.Hosts),
+            ("NetworkGroup", fmcapi.NetworkGroups),
+        ]
+        listed_all = True
+        for obj_type, object_class in object_classes:
+            try:
+                response = object_class(fmc=fmc_client).get()
+                items = response.get("items", []) if response else []
+            except Exception as e:
+                logging.warning(f"Failed to prefetch {obj_type} objects: {str(e)}. "
+                                f"Falling back to individual lookups.")
+                listed_all = False
+                continue
+            listed_all = listed_all and bool(response)
             
-        # Check cache first
-        if obj_id in self._network_object_cache:
-            logging.debug(f"Using cached network object: {obj_id}")
-            return self._network_object_cache[obj_id]
+            for item in items:
+                obj_id = item.get("id")
+                if not obj_id:
+                    continue
+                self._obj_by_id[obj_id] = (obj_type, item)
+                # Freshly listed data replaces anything loaded from the cache file
+                self._cache_resolved_at.pop(obj_id, None)
+                if obj_type == "NetworkGroup":
+                    self._network_object_cache.pop(obj_id, None)
+                else:
+                    self._network_object_cache[obj_id] = self._networks_from_object(obj_type, item)
+            logging.info(f"Prefetched {len(items)} {obj_type} objects")
+        
+        # Expanding a group needs no API call once all its members are indexed
+        if self.cache_file and listed_all:
+            group_ids = [obj_id for obj_id, (obj_type, _) in self._obj_by_id.items()
+                         if obj_type == "NetworkGroup"]
+            for group_id in group_ids:
+                try:
+                    self._resolve_network_object(fmc_client, group_id, "NetworkGroup")
+                except Exception as e:
+                    logging.debug("Could not expand network group %s for the cache: %s",
+                                  group_id, e)
+    
+    @staticmethod
+    def _networks_from_object(obj_type: str, obj_data: Dict) -> List[str]:
+        """
+        Extract the address value of a Network or Host object.
+        
+        Args:
+            obj_type: Object type (Network or Host)
+            obj_data: Object data dictionary from FMC API
             
-        # Prevent circular references
-        if obj_id in visited:
-            logging.warning(f"Circular reference detected for network object {obj_id}")
+        Returns:
+            List with the object's IP address/network, or empty list if it has no value
+        """
+        value = obj_data.get("value")
+        if not value:
             return []
+        # A bare host address parses as /32 (IPv4) or /128 (IPv6)
+        return [value]
+    
+    def _get_network_object(self, fmc_client, obj_id: str, obj_type: str) -> Optional[Dict]:
+        """
+        Get network object data from the prefetched index, or from FMC if not indexed.
+        
+        Args:
+            fmc_client: FMC API client instance
+            obj_id: Object ID to look up
+            obj_type: Object type (Network, NetworkGroup, Host)
+            
+        Returns:
+            Object data dictionary, or None if the object type is not supported
             
-        visited.add(obj_id)
-        networks = []
+        Raises:
+            RuntimeError: If FMC returned no data for the object (e.g., an expired token),
+                so a failed lookup is never cached as an object without addresses
+        """
+        if obj_id in self._obj_by_id:
+            return self._obj_by_id[obj_id][1]
         
         # Direct fmcapi calls - let fmcapi handle HTTP 429 and retries automatically
         # fmcapi has built-in rate limiting with 30s sleep + automatic retry
-        obj_data = None
-        
         if obj_type == "NetworkGroup":
             obj = fmcapi.NetworkGroups(fmc=fmc_client)
-            obj.id = obj_id
-            obj.get()
-            if hasattr(obj, 'literals') or hasattr(obj, 'objects'):
-                # Process literals (direct IP/CIDR values)
-                if hasattr(obj, 'literals'):
-                    for literal in obj.literals:
-                        if "value" in literal:
-                            networks.append(literal["value"])
-                
-                # Process objects (nested references)
-                if hasattr(obj, 'objects'):
-                    for nested_obj in obj.objects:
-                        nested_id = nested_obj.get("id")
-                        nested_type = nested_obj.get("type")
-                        if nested_id and nested_type:
-                            # Recursive call for nested objects
-                            nested_networks = self._resolve_network_object(
-                                fmc_client, nested_id, nested_type, visited
-                            )
-                            networks.extend(nested_networks)
-                            
         elif obj_type == "Network":
             obj = fmcapi.Networks(fmc=fmc_client)
-            obj.id = obj_id
-            obj.get()
-            if hasattr(obj, 'value'):
-                networks.append(obj.value)
-                
         elif obj_type == "Host":
             obj = fmcapi.Hosts(fmc=fmc_client)
-            obj.id = obj_id
-            obj.get()
-            if hasattr(obj, 'value'):
-                networks.append(f"{obj.value}/32")  # Single host as /32
         else:
             logging.warning(f"Unknown network object type: {obj_type}")
-                            
-        logging.debug(f"Resolved network object {obj_id} to {len(networks)} networks")
-            
-        # Cache the result
-        self._network_object_cache[obj_id] = networks
-        return networks
+            return None
+        
+        obj.id = obj_id
+        self._limiter.acquire()
+        obj_data = obj.get()
+        if not obj_data:
+            raise RuntimeError(f"FMC returned no data for {obj_type} object {obj_id}")
+        return obj_data
     
-    def _parse_ip_range(self, ip_range: str) -> List[str]:
+    def _resolve_network_object(self, fmc_client, obj_id: str, obj_type: str) -> List[str]:
         """
-        Parse IP range notation (e.g., 10.1.1.1-10.1.1.10) into list of individual IPs.
+        Resolve a network object/group to its constituent IP addresses/networks.
+        Nested groups are expanded depth-first with an explicit stack. Every object
+        whose expansion completes is cached, so a group shared by several parents is
+        fetched and expanded once. Groups cut short by a circular reference are not
+        cached, since their networks depend on where the cycle was entered.
         
         Args:
-            ip_range: IP range in format "start_ip-end_ip"
+            fmc_client: FMC API client instance
+            obj_id: Object ID to resolve
+            obj_type: Object type (Network, NetworkGroup, Host, etc.)
             
         Returns:
-            List of IP addresses as strings, or empty list if invalid
+            List of IP addresses/networks in CIDR notation
         """
-        try:
-            if '-' not in ip_range:
-                return [ip_range]
-            
-            start_ip_str, end_ip_str = ip_range.split('-', 1)
-            start_ip = ipaddress.ip_address(start_ip_str.strip())
-            end_ip = ipaddress.ip_address(end_ip_str.strip())
-            
-            # Check if range is too large (> 256 IPs) to avoid memory issues
-            ip_count = int(end_ip) - int(start_ip) + 1
-            if ip_count > 256:
-                logging.warning(f"IP range {ip_range} contains {ip_count} addresses, checking start and end only")
-                return [str(start_ip), str(end_ip)]
+        # Check cache first
+        if obj_id in self._network_object_cache:
+            logging.debug("Using cached network object: %s", obj_id)
+            return self._network_object_cache[obj_id]
+        
+        # Groups being expanded, innermost last: (group ID, networks collected so far,
+        # nested references still to expand, IDs of groups left out because of a cycle)
+        frames: List[Tuple[str, List[str], deque, Set[str]]] = []
+        on_path: Set[str] = set()
+        # Objects resolved during this call: ID -> (networks, IDs of groups left out)
+        resolved: Dict[str, Tuple[List[str], Set[str]]] = {}
+        pending: Optional[Tuple[str, str]] = (obj_id, obj_type)
+        
+        while True:
+            if pending is not None:
+                current_id, current_type = pending
+                pending = None
+                if current_id in on_path:
+                    # Circular reference: the group's networks are collected further up the stack
+                    logging.warning("Circular reference detected for network object %s", current_id)
+                    result = ([], {current_id})
+                elif current_id in resolved:
+                    result = resolved[current_id]
+                elif current_id in self._network_object_cache:
+                    result = (self._network_object_cache[current_id], set())
+                else:
+                    obj_data = self._get_network_object(fmc_client, current_id, current_type)
+                    if obj_data is not None and current_type == "NetworkGroup":
+                        # Literals are direct IP/CIDR values; nested objects are expanded next
+                        literals = [literal["value"] for literal in obj_data.get("literals", [])
+                                    if "value" in literal]
+                        nested = deque(
+                            (nested_obj["id"], nested_obj["type"])
+                            for nested_obj in obj_data.get("objects", [])
+                            if nested_obj.get("id") and nested_obj.get("type")
+                        )
+                        frames.append((current_id, literals, nested, set()))
+                        on_path.add(current_id)
+                        continue
+                    networks = (self._networks_from_object(current_type, obj_data)
+                                if obj_data else [])
+                    result = resolved[current_id] = (networks, set())
+                    with self._cache_lock:
+                        self._network_object_cache[current_id] = networks
+            else:
+                group_id, networks, nested, left_out = frames[-1]
+                if nested:
+                    pending = nested.popleft()
+                    continue
+                
+                # Group fully expanded; a cycle back to the group itself leaves nothing out
+                frames.pop()
+                on_path.discard(group_id)
+                left_out.discard(group_id)
+                result = resolved[group_id] = (networks, left_out)
+                if left_out:
+                    logging.debug("Not caching network group %s: it is part of a circular "
+                                  "reference", group_id)
+                else:
+                    with self._cache_lock:
+                        self._network_object_cache[group_id] = networks
             
-            # Generate all IPs in range
-            ips = []
-            current = start_ip
-            while current <= end_ip:
-                ips.append(str(current))
-                current += 1
-            return ips
+            if not frames:
+                break
+            frames[-1][1].extend(result[0])
+            frames[-1][3].update(result[1])
+        
+        networks = result[0]
+        logging.debug("Resolved network object %s to %d networks", obj_id, len(networks))
+        return networks
+    
+    def _uncached_object_ids(self, rule_data: Dict) -> Set[str]:
+        """
+        Collect the network objects of a rule that are missing from the network object cache.
+        
+        Args:
+            rule_data: Rule data dictionary from FMC API
             
-        except Exception as e:
-            logging.warning(f"Failed to parse IP range '{ip_range}': {e}")
-            return []
+        Returns:
+            IDs of the objects that resolving the rule's networks would fetch from FMC
+        """
+        return {
+            obj["id"]
+            for network_type in ("sourceNetworks", "destinationNetworks")
+            for obj in rule_data.get(network_type, {}).get("objects", ())
+            if obj.get("id") and obj.get("name", "").lower() != "any"
+            and obj["id"] not in self._network_object_cache
+        }
     
-    def _ip_overlaps_with_excluded_prefixes(self, ip_or_network: str) -> bool:
+    def _resolve_network_objects_concurrently(self, fmc_client, networks: Dict[str, Dict]) -> None:
         """
-        Check if an IP address or network overlaps with any excluded prefix.
+        Fetch the network objects of a rule that are neither indexed nor cached in parallel.
+        
+        Objects in the prefetched index need no API call, so they are left to the
+        sequential check. Errors are ignored here; the sequential check that follows
+        resolves the object again and logs them.
+        
+        Args:
+            fmc_client: FMC API client instance
+            networks: Source/destination network entries of the rule
+        """
+        pairs = {
+            (obj["id"], obj["type"])
+            for networks_data in networks.values()
+            for obj in networks_data.get("objects", ())
+            if obj.get("id") and obj.get("type") and obj.get("name", "").lower() != "any"
+            and obj["id"] not in self._network_object_cache and obj["id"] not in self._obj_by_id
+        }
+        if len(pairs) < 2:
+            return
+        
+        futures = [
+            self._resolver_pool.submit(self._resolve_network_object, fmc_client, obj_id, obj_type)
+            for obj_id, obj_type in pairs
+        ]
+        for future in futures:
+            if future.exception() is not None:
+                logging.debug("Concurrent network object resolution failed: %s", future.exception())
+    
+    def _ip_overlaps_with_excluded_prefixes(
+        self, ip_or_network: str
+    ) -> Optional[Union[ipaddress.IPv4Network, ipaddress.IPv6Network]]:
+        """
+        Find the excluded prefix an IP address or network overlaps with, if any.
         Handles CIDR notation, single IPs, and IP ranges (e.g., 10.1.1.1-10.1.1.10).
         
         Args:
             ip_or_network: IP address, network in CIDR notation, or IP range
             
         Returns:
-            True if overlaps with any excluded prefix, False otherwise
+            The matching excluded prefix, or None if there is none
         """
         if not self.exclude_prefixes:
-            return False
+            return None
         
-        # Check if it's an IP range (contains '-')
-        if '-' in ip_or_network:
-            ips_to_check = self._parse_ip_range(ip_or_network)
-            if not ips_to_check:
-                return False  # Invalid range, can't determine overlap
-            
-            # Check each IP in the range (or just start/end for large ranges)
-            for ip_str in ips_to_check:
-                try:
-                    ip = ipaddress.ip_address(ip_str)
-                    for excluded_prefix in self.exclude_prefixes:
-                        if ip in excluded_prefix:
-                            logging.debug(f"IP {ip_str} from range {ip_or_network} is in excluded prefix {excluded_prefix}")
-                            return True
-                except ValueError:
-                    continue
-            return False
+        return _overlaps_cached(ip_or_network, self.prefix_match_mode, self._exclude_prefixes_key)
             
-        # Handle CIDR notation or single IP
-        try:
-            # Parse the IP/network
-            network = ipaddress.ip_network(ip_or_network, strict=False)
-            
-            # Check based on match mode
-            for excluded_prefix in self.exclude_prefixes:
-                if self.prefix_match_mode == 'overlap':
-                    # Check if networks overlap in any way (default behavior)
-                    if network.overlaps(excluded_prefix):
-                        logging.debug(f"Network {ip_or_network} overlaps with excluded prefix {excluded_prefix}")
-                        return True
-                elif self.prefix_match_mode == 'subnet':
-                    # Check if network is a subnet of (contained within) the excluded prefix
-                    if network.subnet_of(excluded_prefix):
-                        logging.debug(f"Network {ip_or_network} is subnet of excluded prefix {excluded_prefix}")
-                        return True
-                    
-        except ValueError as e:
-            logging.warning(f"Invalid IP/network '{ip_or_network}': {e}")
-            return False
-            
-        return False
+    @staticmethod
+    def _extract_features(rule_data: Dict) -> _RuleFeatures:
+        """
+        Extract the fields needed to decide whether to disable a rule in a single pass.
+        
+        Args:
+            rule_data: Rule data dictionary from FMC API
             
-    def _is_rule_in_excluded_zone(self, rule_data: Dict) -> bool:
+        Returns:
+            _RuleFeatures for the rule
+        """
+        comment_history = rule_data.get("commentHistoryList")
+        first_comment = comment_history[0] if comment_history else {}
+        return _RuleFeatures(
+            name=rule_data.get("name", "Unknown"),
+            enabled=bool(rule_data.get("enabled")),
+            action=rule_data.get("action", ""),
+            zone_names=tuple(
+                zone_obj.get("name")
+                for zone_type in ("sourceZones", "destinationZones")
+                for zone_obj in rule_data.get(zone_type, {}).get("objects", ())
+            ),
+            networks={
+                network_type: rule_data[network_type]
+                for network_type in ("sourceNetworks", "destinationNetworks")
+                if network_type in rule_data
+            },
+            has_comment_history=bool(comment_history),
+            first_comment_text=first_comment.get("comment", ""),
+            first_comment_date=first_comment.get("date", ""),
+        )
+    
+    def _is_rule_in_excluded_zone(self, features: _RuleFeatures) -> bool:
         """
         Check if rule involves any excluded zones.
         
         Args:
-            rule_data: Rule data dictionary from FMC API
+            features: Rule fields extracted by _extract_features
             
         Returns:
             True if rule should be excluded, False otherwise
@@ -339,27 +1024,16 @@ class FMCRuleManager:
         if not self.exclude_zones:
             return False
             
-        # Check source zones
-        if "sourceZones" in rule_data and "objects" in rule_data["sourceZones"]:
-            for zone_obj in rule_data["sourceZones"]["objects"]:
-                if zone_obj.get("name") in self.exclude_zones:
-                    return True
-                    
-        # Check destination zones
-        if "destinationZones" in rule_data and "objects" in rule_data["destinationZones"]:
-            for zone_obj in rule_data["destinationZones"]["objects"]:
-                if zone_obj.get("name") in self.exclude_zones:
-                    return True
-                    
-        return False
+        # Check source and destination zones
+        return not self.exclude_zones.isdisjoint(features.zone_names)
     
-    def _is_rule_using_excluded_prefix(self, fmc_client, rule_data: Dict) -> bool:
+    def _is_rule_using_excluded_prefix(self, fmc_client, features: _RuleFeatures) -> bool:
         """
         Check if rule involves any excluded IP prefixes in source or destination networks.
         
         Args:
             fmc_client: FMC API client instance
-            rule_data: Rule data dictionary from FMC API
+            features: Rule fields extracted by _extract_features
             
         Returns:
             True if rule should be excluded, False otherwise
@@ -367,23 +1041,44 @@ class FMCRuleManager:
         if not self.exclude_prefixes:
             return False
             
-        rule_name = rule_data.get("name", "Unknown")
+        rule_name = features.name
+        rule_networks = features.networks
+        # Logged here rather than in the memoized overlap check, so every match is explained
+        relation = "is subnet of" if self.prefix_match_mode == 'subnet' else "overlaps with"
         
-        # Check both source and destination networks
-        for network_type in ["sourceNetworks", "destinationNetworks"]:
-            if network_type not in rule_data:
-                continue
-                
-            networks_data = rule_data[network_type]
-            
-            # Check literals (direct IP/CIDR values)
+        # Fast path for overlap mode: "any" overlaps everything of its IP version, so
+        # decide before resolving any network objects
+        if self.prefix_match_mode == 'overlap':
+            if not rule_networks:
+                # No networks on either side means the rule matches any address
+                logging.info("Rule '%s' has no source or destination networks (implicit 'any') "
+                             "which overlaps with excluded prefixes (overlap mode)", rule_name)
+                return True
+            for network_type, networks_data in rule_networks.items():
+                for obj in networks_data.get("objects", ()):
+                    versions = _ANY_NETWORK_VERSIONS.get(obj.get("name", "").lower(), ())
+                    if any(version in self._exclude_prefix_versions for version in versions):
+                        logging.info("Rule '%s' uses '%s' in %s which overlaps with excluded "
+                                     "prefixes (overlap mode)", rule_name, obj['name'],
+                                     network_type)
+                        return True
+        
+        # Check literals (direct IP/CIDR values) first; they need no API calls
+        for network_type, networks_data in rule_networks.items():
             if "literals" in networks_data:
                 for literal in networks_data["literals"]:
                     if "value" in literal:
-                        if self._ip_overlaps_with_excluded_prefixes(literal["value"]):
-                            logging.info(f"Rule '{rule_name}' uses excluded prefix in {network_type} literal: {literal['value']}")
+                        excluded_prefix = self._ip_overlaps_with_excluded_prefixes(literal["value"])
+                        if excluded_prefix is not None:
+                            logging.debug("Network %s %s excluded prefix %s",
+                                          literal["value"], relation, excluded_prefix)
+                            logging.info("Rule '%s' uses excluded prefix in %s literal: %s",
+                                         rule_name, network_type, literal['value'])
                             return True
-            
+        
+        self._resolve_network_objects_concurrently(fmc_client, rule_networks)
+        
+        for network_type, networks_data in rule_networks.items():
             # Check objects (named network objects/groups)
             if "objects" in networks_data:
                 for obj in networks_data["objects"]:
@@ -394,17 +1089,11 @@ class FMCRuleManager:
                     if not obj_id or not obj_type:
                         continue
                     
-                    # Special handling for "any" - typically means all IPs
+                    # Special handling for "any" - typically means all IPs. Overlap mode
+                    # already returned above; in subnet mode we only care about specific subnets
                     if obj_name.lower() == "any":
-                        # Behavior depends on match mode
-                        if self.prefix_match_mode == 'overlap':
-                            # In overlap mode, "any" overlaps with everything
-                            if self.exclude_prefixes:
-                                logging.info(f"Rule '{rule_name}' uses 'any' in {network_type} which overlaps with excluded prefixes (overlap mode)")
-                                return True
-                        elif self.prefix_match_mode == 'subnet':
-                            # In subnet mode, ignore "any" - we only care about specific subnets
-                            logging.debug(f"Rule '{rule_name}' uses 'any' in {network_type} - ignoring in subnet mode")
+                        logging.debug("Rule '%s' uses 'any' in %s - ignoring in subnet mode",
+                                      rule_name, network_type)
                         continue
                     
                     # Resolve the network object to actual IPs
@@ -413,68 +1102,78 @@ class FMCRuleManager:
                         
                         # Check each resolved network against excluded prefixes
                         for network in resolved_networks:
-                            if self._ip_overlaps_with_excluded_prefixes(network):
-                                logging.info(f"Rule '{rule_name}' uses excluded prefix in {network_type} object '{obj_name}': {network}")
+                            excluded_prefix = self._ip_overlaps_with_excluded_prefixes(network)
+                            if excluded_prefix is not None:
+                                logging.debug("Network %s %s excluded prefix %s",
+                                              network, relation, excluded_prefix)
+                                logging.info("Rule '%s' uses excluded prefix in %s object '%s': %s",
+                                             rule_name, network_type, obj_name, network)
                                 return True
                                 
                     except Exception as e:
-                        logging.error(f"Error resolving network object {obj_name} ({obj_id}): {str(e)}")
+                        logging.error("Error resolving network object %s (%s): %s",
+                                      obj_name, obj_id, e)
                         continue
         
         return False
         
-    def _should_disable_rule(self, rule_data: Dict, current_time: str, fmc_client=None) -> tuple[bool, str]:
+    def _should_disable_rule(self, features: _RuleFeatures, current_time: str,
+                             fmc_client=None) -> tuple[bool, str]:
         """
         Determine if a rule should be disabled based on criteria.
         
         Args:
-            rule_data: Rule data dictionary from FMC API
+            features: Rule fields extracted by _extract_features
             current_time: Current timestamp string
             fmc_client: FMC API client instance (optional, required for prefix exclusion)
             
         Returns:
             Tuple of (should_disable: bool, reason: str)
         """
-        rule_name = rule_data.get("name", "Unknown")
+        rule_name = features.name
         
-        # Check if rule is in excluded zone
-        if self._is_rule_in_excluded_zone(rule_data):
-            logging.info(f"Rule '{rule_name}' skipped - involves excluded zone")
-            return False, "Rule involves excluded zone"
+        # Checks run cheapest first; the excluded prefix check may need API calls,
+        # so it only runs for rules that would otherwise be disabled
         
-        # Check if rule uses excluded IP prefixes
-        if fmc_client and self._is_rule_using_excluded_prefix(fmc_client, rule_data):
-            logging.info(f"Rule '{rule_name}' skipped - involves excluded IP prefix")
-            return False, "Rule involves excluded IP prefix"
-            
         # Check if rule is enabled and has a matching action
-        rule_action = rule_data.get("action", "")
-        if not (rule_data.get("enabled") and rule_action in self.rule_actions):
+        rule_action = features.action
+        if not (features.enabled and rule_action in self._rule_action_set):
             return False, f"Rule is not enabled or action '{rule_action}' not in allowed actions {self.rule_actions}"
             
         # Check comment history
-        if "commentHistoryList" in rule_data:
-            first_comment = rule_data["commentHistoryList"][0]
-            first_comment_date = first_comment.get("date", "")
-            first_comment_text = first_comment.get("comment", "")
+        if features.has_comment_history:
+            first_comment_date = features.first_comment_date
+            first_comment_text = features.first_comment_text
             
             # Check for previous script comments
-            if "DisabledByHitCountScript" in first_comment_text:
-                return True, f"Rule previously marked by script: {first_comment_text}"
-                
-            # Check if rule is old (created before specified year threshold)
-            try:
-                year = int(first_comment_date.split("-")[0])
-                if year < self.year_threshold:
-                    return True, f"Rule created before {self.year_threshold} (first comment: {first_comment_date})"
-            except (ValueError, IndexError):
-                logging.warning(f"Could not parse date for rule '{rule_name}': {first_comment_date}")
-                
+            if first_comment_text.startswith(_SCRIPT_TAG):
+                disable_reason = f"Rule previously marked by script: {first_comment_text}"
+            else:
+                # Check if rule is old (created before specified year threshold)
+                year = _year_of(first_comment_date)
+                if year is None:
+                    logging.warning("Could not parse date for rule '%s': %s",
+                                    rule_name, first_comment_date)
+                    return False, "Rule does not meet disable criteria"
+                if year >= self.year_threshold:
+                    return False, "Rule does not meet disable criteria"
+                disable_reason = (f"Rule created before {self.year_threshold} "
+                                  f"(first comment: {first_comment_date})")
         else:
             # No comment history - disable
-            return True, "No comment history found"
+            disable_reason = "No comment history found"
+        
+        # Check if rule is in excluded zone
+        if self._is_rule_in_excluded_zone(features):
+            logging.info("Rule '%s' skipped - involves excluded zone", rule_name)
+            return False, "Rule involves excluded zone"
+        
+        # Check if rule uses excluded IP prefixes
+        if fmc_client and self._is_rule_using_excluded_prefix(fmc_client, features):
+            logging.info("Rule '%s' skipped - involves excluded IP prefix", rule_name)
+            return False, "Rule involves excluded IP prefix"
             
-        return False, "Rule does not meet disable criteria"
+        return True, disable_reason
     
     def _get_ignore_detail(self, rule_data: Dict, reason: str) -> str:
         """
@@ -487,88 +1186,334 @@ class FMCRuleManager:
         Returns:
             Detailed explanation string
         """
-        rule_name = rule_data.get("name", "Unknown")
+        # Lower-cased once; the reason is matched against each category below
+        reason_lower = reason.lower()
         
         # Check for excluded zone
-        if "excluded zone" in reason.lower():
-            zones = []
-            for zone_type in ["sourceZones", "destinationZones"]:
-                if zone_type in rule_data and "objects" in rule_data[zone_type]:
-                    for zone_obj in rule_data[zone_type]["objects"]:
-                        zone_name = zone_obj.get("name")
-                        if zone_name in self.exclude_zones:
-                            zones.append(f"{zone_type.replace('Zones', '')}: {zone_name}")
+        if "excluded zone" in reason_lower:
+            zones = [
+                f"{zone_type.replace('Zones', '')}: {zone_obj.get('name')}"
+                for zone_type in ("sourceZones", "destinationZones")
+                for zone_obj in rule_data.get(zone_type, {}).get("objects", ())
+                if zone_obj.get("name") in self.exclude_zones
+            ]
             return "Zones: " + ", ".join(zones) if zones else "Excluded zone found"
         
         # Check for excluded IP prefix
-        if "excluded IP prefix" in reason.lower() or "excluded ip prefix" in reason.lower():
+        if "excluded ip prefix" in reason_lower:
             # Try to identify which networks matched
-            networks_found = []
-            
-            # Debug: Check if network data exists
-            has_source = "sourceNetworks" in rule_data
-            has_dest = "destinationNetworks" in rule_data
+            def network_labels(network_type: str, prefix: str):
+                networks_data = rule_data.get(network_type) or {}
+                for literal in networks_data.get("literals") or ():
+                    value = literal.get("value", "")
+                    if value:
+                        yield f"{prefix}:{value}"
+                for obj in networks_data.get("objects") or ():
+                    obj_name = obj.get("name", "")
+                    if obj_name:
+                        label = "ANY" if obj_name.lower() == "any" else obj_name
+                        yield f"{prefix}:{label}"
             
-            for network_type in ["sourceNetworks", "destinationNetworks"]:
-                if network_type not in rule_data:
-                    continue
-                    
-                networks_data = rule_data.get(network_type, {})
-                if not networks_data:
-                    continue
-                
-                # Check literals
-                if "literals" in networks_data and networks_data["literals"]:
-                    for literal in networks_data["literals"]:
-                        value = literal.get("value", "")
-                        if value:
-                            prefix = "src" if network_type == "sourceNetworks" else "dst"
-                            networks_found.append(f"{prefix}:{value}")
-                
-                # Check objects
-                if "objects" in networks_data and networks_data["objects"]:
-                    for obj in networks_data["objects"]:
-                        obj_name = obj.get("name", "")
-                        if obj_name:
-                            prefix = "src" if network_type == "sourceNetworks" else "dst"
-                            if obj_name.lower() == "any":
-                                networks_found.append(f"{prefix}:ANY")
-                            else:
-                                networks_found.append(f"{prefix}:{obj_name}")
+            networks_found = chain(network_labels("sourceNetworks", "src"),
+                                   network_labels("destinationNetworks", "dst"))
+            # Limit to first 4 items for readability, counting the rest without
+            # building them into a list
+            shown = list(islice(networks_found, 4))
+            remaining = sum(1 for _ in networks_found)
             
             # Build detail string
-            if networks_found:
-                # Limit to first 4 items for readability
-                network_str = ", ".join(networks_found[:4])
-                if len(networks_found) > 4:
-                    network_str += f" (+{len(networks_found)-4} more)"
+            if shown:
+                network_str = ", ".join(shown)
+                if remaining:
+                    network_str += f" (+{remaining} more)"
                 return f"mode:{self.prefix_match_mode} | {network_str}"
+            elif "sourceNetworks" not in rule_data and "destinationNetworks" not in rule_data:
+                return f"mode:{self.prefix_match_mode} | src:ANY, dst:ANY (no networks set)"
             else:
                 # Fallback if no networks found
                 return f"mode:{self.prefix_match_mode} | (network details unavailable)"
         
         # Check for action/enabled issues
-        if "not enabled" in reason.lower() or "action" in reason.lower():
+        if "not enabled" in reason_lower or "action" in reason_lower:
             rule_enabled = rule_data.get("enabled", False)
             rule_action = rule_data.get("action", "UNKNOWN")
             return f"Enabled: {rule_enabled} | Action: {rule_action} | Required actions: {', '.join(self.rule_actions)}"
         
         # Check for criteria not met (age-based)
-        if "does not meet disable criteria" in reason.lower():
+        if "does not meet disable criteria" in reason_lower:
             # Get rule creation date from comment history
             if "commentHistoryList" in rule_data and rule_data["commentHistoryList"]:
                 first_comment = rule_data["commentHistoryList"][0]
                 first_comment_date = first_comment.get("date", "Unknown")
-                try:
-                    year = int(first_comment_date.split("-")[0])
+                year = _year_of(first_comment_date)
+                if year is not None:
                     return f"Rule created in {year} (threshold: before {self.year_threshold})"
-                except (ValueError, IndexError):
-                    return f"Rule created: {first_comment_date} | Threshold: before {self.year_threshold}"
+                return (f"Rule created: {first_comment_date} | "
+                        f"Threshold: before {self.year_threshold}")
             return f"Rule does not meet age criteria (threshold: before {self.year_threshold})"
         
         # Default detail
         return reason
         
+    def _get_page(self, fmc_client, url: str) -> Optional[Dict]:
+        """
+        GET a single page of a listing, paced by the rate limiter.
+        
+        fmcapi's send_to_api follows the paging links of a listing by itself, so its
+        paging limit is lowered for the call to stop after the requested page. Only
+        used before the worker pools start, while no other thread shares the client.
+        
+        Args:
+            fmc_client: FMC API client instance
+            url: URL of the page, including its limit and offset
+            
+        Returns:
+            The page as returned by FMC, or None if the request failed
+        """
+        self._limiter.acquire()
+        max_paging_requests = fmc_client.MAX_PAGING_REQUESTS
+        fmc_client.MAX_PAGING_REQUESTS = -1
+        try:
+            return fmc_client.send_to_api(method="get", url=url)
+        finally:
+            fmc_client.MAX_PAGING_REQUESTS = max_paging_requests
+    
+    def _list_rules(self, fmc_client, acp_id: str, rule_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch the access policy's rules with paged, expanded list calls.
+        
+        Pages are requested one at a time so each one is paced by the rate limiter,
+        and listing stops once every requested rule has been seen. If the first page
+        carries no comment history at all, the listing is abandoned: every rule would
+        need its own GET anyway, so paging through the policy would only add calls.
+        
+        Args:
+            fmc_client: FMC API client instance
+            acp_id: Access control policy ID
+            rule_ids: IDs of the rules to keep
+            
+        Returns:
+            Dictionary mapping rule ID to rule data for the requested rules listed with
+            their comment history. Listed rules without a commentHistoryList are left
+            out so they are fetched individually instead of being judged on incomplete
+            data (a missing comment history makes a rule eligible for disabling)
+        """
+        max_retries = RULE_FETCH_MAX_RETRIES
+        rules_url = fmcapi.AccessRules(fmc=fmc_client, acp_id=acp_id).URL
+        url = f"{rules_url}?expanded=true&limit={self.page_limit}"
+        wanted = set(rule_ids)
+        rules_by_id = {}
+        incomplete = 0
+        listed = 0
+        
+        while url and len(rules_by_id) + incomplete < len(wanted):
+            page = None
+            for attempt in range(max_retries):
+                try:
+                    page = self._get_page(fmc_client, url)
+                    break
+                except requests.exceptions.ConnectTimeout:
+                    if attempt == max_retries - 1:
+                        logging.warning(f"Connection timeout listing access rules after "
+                                        f"{max_retries} attempts")
+                        break
+                    delay = _backoff_delay(attempt)
+                    logging.warning(f"Connection timeout listing access rules. Retrying in "
+                                    f"{delay:.1f}s (attempt {attempt+1}/{max_retries})...")
+                    time.sleep(delay)
+            
+            if page is None:
+                logging.warning("Could not list access rules; the remaining rules will be "
+                                "fetched one by one")
+                break
+            
+            items = page.get("items", [])
+            if not listed and items and not any("commentHistoryList" in rule for rule in items):
+                logging.info("Access rule listing omits comment history; rules will be "
+                             "fetched one by one")
+                return {}
+            listed += len(items)
+            for rule in items:
+                if rule.get("id") not in wanted:
+                    continue
+                if "commentHistoryList" not in rule:
+                    incomplete += 1
+                    continue
+                rules_by_id[rule["id"]] = rule
+            url = (page.get("paging", {}).get("next") or [None])[0]
+        
+        logging.info("Listed %d access rules (%d to process, %d without comment history "
+                     "to fetch individually)", listed, len(rules_by_id), incomplete)
+        return rules_by_id
+    
+    def _get_rule(self, fmc_client, acp_id: str, rule_id: str) -> Optional[Dict]:
+        """
+        Fetch a single access rule by ID.
+        
+        Args:
+            fmc_client: FMC API client instance
+            acp_id: Access control policy ID
+            rule_id: ID of the rule to fetch
+            
+        Returns:
+            Rule data dictionary, or None if FMC returned no data
+        """
+        self._limiter.acquire()
+        try:
+            return fmcapi.AccessRules(fmc=fmc_client, acp_id=acp_id, id=rule_id).get()
+        except TypeError:
+            # fmcapi indexes a None response (failed request) after a GET by ID
+            return None
+    
+    def _fetch_rules_concurrently(self, fmc_client, acp_id: str,
+                                  rule_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch access rules in parallel with a thread pool sized from the API rate limit.
+        
+        A fetch that returns no data is retried once, since a request sent while
+        another worker refreshes the token can fail. Rules whose fetch times out or
+        still returns no data are left out of the result so the caller can retry them
+        with its regular backoff.
+        
+        Args:
+            fmc_client: FMC API client instance
+            acp_id: Access control policy ID
+            rule_ids: IDs of the rules to fetch
+            
+        Returns:
+            Dictionary mapping rule ID to rule data
+        """
+        def fetch(rule_id: str) -> Optional[Dict]:
+            for attempt in range(2):
+                rule_data = self._get_rule(fmc_client, acp_id, rule_id)
+                if rule_data is not None:
+                    return rule_data
+                if attempt == 0:
+                    logging.warning("No data returned for rule ID %s. Retrying once.", rule_id)
+            return None
+        
+        rules_by_id: Dict[str, Dict] = {}
+        with ThreadPoolExecutor(max_workers=self._rule_fetch_workers,
+                                thread_name_prefix="rule-fetch") as pool:
+            futures = {pool.submit(fetch, rule_id): rule_id for rule_id in rule_ids}
+            for completed, future in enumerate(as_completed(futures), 1):
+                rule_id = futures[future]
+                try:
+                    rule_data = future.result()
+                except requests.exceptions.ConnectTimeout:
+                    logging.warning("Connection timeout fetching rule ID %s. It will be retried "
+                                    "during processing.", rule_id)
+                else:
+                    if rule_data is not None:
+                        rules_by_id[rule_id] = rule_data
+                    else:
+                        logging.warning("No data returned for rule ID %s. It will be retried "
+                                        "during processing.", rule_id)
+                print_progress_bar(completed, len(futures), prefix='Fetching:', suffix='rules',
+                                   length=50)
+        
+        logging.info(f"Fetched {len(rules_by_id)}/{len(rule_ids)} rules concurrently")
+        return rules_by_id
+    
+    def _flush_disabled_rules(self, fmc_client, rules_url: str,
+                              pending: List[Tuple[Dict, Dict]], stats: Dict) -> int:
+        """
+        Disable a batch of rules with a single bulk PUT request.
+        
+        If FMC rejects the bulk request (one invalid rule fails the whole batch, or
+        the FMC version has no bulk PUT), the rules are disabled one at a time
+        instead, and so are the rules of every later batch.
+        
+        Args:
+            fmc_client: FMC API client instance
+            rules_url: URL of the policy's access rules
+            pending: List of (rule details, rule JSON with enabled=False) tuples; cleared on return
+            stats: Operation statistics to update
+            
+        Returns:
+            Number of rules disabled
+        """
+        if not pending:
+            return 0
+        
+        response = None
+        # Set once FMC rejects a bulk request (e.g., no bulk PUT support); later batches
+        # then go straight to per-rule requests instead of failing in bulk first
+        bulk_rejected = self._bulk_put_rejected
+        
+        if not bulk_rejected:
+            json_data = [rule_json for _, rule_json in pending]
+            max_retries = len(BULK_DISABLE_RETRY_DELAYS)
+            for attempt in range(max_retries):
+                try:
+                    self._limiter.acquire()
+                    response = fmc_client.send_to_api(method="put", url=f"{rules_url}?bulk=true",
+                                                      json_data=json_data)
+                    # None means FMC answered with an error, as opposed to timing out
+                    bulk_rejected = response is None
+                    break
+                except (requests.exceptions.ReadTimeout, requests.exceptions.ConnectTimeout) as e:
+                    if attempt < max_retries - 1:
+                        delay = BULK_DISABLE_RETRY_DELAYS[attempt]
+                        logging.warning("Timeout disabling %d rules. Retrying in %ss "
+                                        "(attempt %d/%d)...",
+                                        len(pending), delay, attempt + 1, max_retries)
+                        print(f"\nTimeout disabling rules. Retrying in {delay}s...")
+                        time.sleep(delay)
+                    else:
+                        logging.error("Failed to disable %d rules after %d attempts: %s",
+                                      len(pending), max_retries, e)
+                        print(f"\nFailed to disable {len(pending)} rules "
+                              f"after {max_retries} attempts")
+            
+            if bulk_rejected:
+                self._bulk_put_rejected = True
+                logging.warning("Bulk disable of %d rules failed. Disabling rules one at a time "
+                                "for the rest of the run.", len(pending))
+        
+        disabled = 0
+        for rule_details, rule_json in pending:
+            if bulk_rejected:
+                rule_url = f"{rules_url}/{rule_details['id']}"
+                rule_disabled = self._put_disabled_rule(fmc_client, rule_url, rule_json)
+            else:
+                rule_disabled = response is not None
+            
+            if rule_disabled:
+                # Full details in log file, minimal console output
+                logging.info("Disabled rule '%s' - %s",
+                             rule_details['name'], rule_details['reason'])
+                stats["rules_disabled"] += 1
+                stats["disabled_rules_details"].append(rule_details)
+                disabled += 1
+            else:
+                # Failed to disable - don't count as disabled
+                logging.warning("Skipping rule '%s' - disable request failed", rule_details['name'])
+                stats["skipped_rules"] += 1
+        
+        pending.clear()
+        return disabled
+    
+    def _put_disabled_rule(self, fmc_client, rule_url: str, rule_json: Dict) -> bool:
+        """
+        Disable a single rule with its own PUT request (fallback for a rejected bulk request).
+        
+        Args:
+            fmc_client: FMC API client instance
+            rule_url: URL of the access rule
+            rule_json: Rule JSON with enabled=False and the disable comment
+            
+        Returns:
+            True if FMC accepted the update, False otherwise
+        """
+        try:
+            self._limiter.acquire()
+            response = fmc_client.send_to_api(method="put", url=rule_url, json_data=rule_json)
+            return response is not None
+        except (requests.exceptions.ReadTimeout, requests.exceptions.ConnectTimeout) as e:
+            logging.warning("Timeout disabling rule ID %s: %s", rule_json.get("id"), e)
+            return False
+    
     def analyze_and_disable_rules(self) -> Dict[str, int]:
         """
         Main method to analyze hit counts and disable unused rules.
@@ -601,6 +1546,8 @@ class FMCRuleManager:
             debug=self.debug,
             timeout=self.timeout
         ) as fmc_client:
+            # Rules and network objects are fetched from worker threads sharing this client
+            _serialize_token_refresh(fmc_client)
             
             # Log info to file
             logging.info(f"Starting hit count analysis for device '{self.device_name}' at {current_time}")
@@ -636,44 +1583,100 @@ class FMCRuleManager:
                 logging.error("No hit count data received from FMC")
                 return stats
             
-            # Identify rules with zero hits
+            # Identify rules with zero hits in a single pass. Only the IDs that will be
+            # processed are kept; the hit count items are released once scanned
             zero_hit_rule_ids = []
-            for item in hit_count_result["items"]:
-                stats["total_rules_analyzed"] += 1
-                rule_name = item["rule"]["name"]
-                rule_type = item["rule"].get("type", "Unknown")
+            hit_count_items = hit_count_result.pop("items")
+            del hit_count_result
+            stats["total_rules_analyzed"] = len(hit_count_items)
+            # Counted locally and stored in stats once after the loop
+            zero_hit_count = 0
+            # Checked once so the per-rule debug lines cost nothing when debug logging is off
+            log_hits = logging.getLogger().isEnabledFor(logging.DEBUG)
+            for item in hit_count_items:
+                rule = item["rule"]
                 hit_count = item["hitCount"]
                 
-                logging.debug(f"Rule '{rule_name}' has {hit_count} hits")
+                if log_hits:
+                    logging.debug("Rule '%s' has %s hits", rule["name"], hit_count)
                 
-                if hit_count == 0:
-                    # Only process AccessRule types, skip default actions and other special rule types
-                    if rule_type == "AccessRule":
-                        zero_hit_rule_ids.append(item["rule"]["id"])
-                        stats["zero_hit_rules"] += 1
-                    else:
-                        logging.debug(f"Skipping rule '{rule_name}' with type '{rule_type}' - not a regular access rule")
+                # Rules with hits are the common case and need nothing else
+                if hit_count != 0:
+                    continue
+                
+                # Only process AccessRule types, skip default actions and other special rule types
+                rule_type = rule.get("type", "Unknown")
+                if rule_type == "AccessRule":
+                    zero_hit_count += 1
+                    if len(zero_hit_rule_ids) < self.max_rules_to_disable:
+                        zero_hit_rule_ids.append(rule["id"])
+                elif log_hits:
+                    logging.debug("Skipping rule '%s' with type '%s' - not a regular access rule",
+                                  rule["name"], rule_type)
+            del hit_count_items
+            stats["zero_hit_rules"] = zero_hit_count
+            
+            logging.info(f"Found {stats['zero_hit_rules']} rules with zero hit counts")
+            total_to_process = len(zero_hit_rule_ids)
+            if stats["zero_hit_rules"] > total_to_process:
+                logging.info(f"Reached maximum rule processing limit: {total_to_process}")
             
-            logging.info(f"Found {len(zero_hit_rule_ids)} rules with zero hit counts")
-            total_to_process = min(len(zero_hit_rule_ids), self.max_rules_to_disable)
             # Only print minimal info to console - zero hit rules found and starting progress
-            print(f"\nFound {len(zero_hit_rule_ids)} rules with zero hit counts")
+            print(f"\nFound {stats['zero_hit_rules']} rules with zero hit counts")
+            
+            # List the policy's rules in pages instead of fetching them one by one. Rules
+            # missing from the list (or listed without their comment history) are fetched
+            # concurrently; any that time out are fetched again one by one with backoff in
+            # the loop below
+            rules_by_id = self._list_rules(fmc_client, acp_id, zero_hit_rule_ids)
+            missing_rule_ids = [
+                rule_id for rule_id in zero_hit_rule_ids if rule_id not in rules_by_id
+            ]
+            if missing_rule_ids:
+                rules_by_id.update(
+                    self._fetch_rules_concurrently(fmc_client, acp_id, missing_rule_ids)
+                )
+            
+            # Index network objects up front so prefix checks don't fetch them one by one.
+            # Only worth it if the rules passing the cheap enabled/action check (and so able
+            # to reach the prefix check) reference more objects than the cache, e.g. a fresh
+            # --cache-file, can answer; a rule that could not be fetched may need any object
+            if self.exclude_prefixes:
+                uncached_ids: Optional[Set[str]] = set()
+                for rule_data in map(rules_by_id.get, zero_hit_rule_ids):
+                    if rule_data is None:
+                        uncached_ids = None
+                        break
+                    if (rule_data.get("enabled")
+                            and rule_data.get("action") in self._rule_action_set):
+                        uncached_ids.update(self._uncached_object_ids(rule_data))
+                if uncached_ids is None or len(uncached_ids) > PREFETCH_MIN_UNCACHED_OBJECTS:
+                    self._prefetch_object_index(fmc_client)
             print(f"Processing {total_to_process} rules...")
             
             # Process each zero-hit rule
             disabled_count = 0
             processed_count = 0
+            # Rules ignored by the disable criteria; stored in stats once after the loop
+            ignored_count = 0
+            # Rules to disable, sent to FMC in bulk PUT requests of BULK_DISABLE_CHUNK_SIZE rules
+            pending_disables: List[Tuple[Dict, Dict]] = []
+            # The rules endpoint only depends on the policy, so build it once
+            rules_url = fmcapi.AccessRules(fmc=fmc_client, acp_id=acp_id).URL
+            # Bound once so the loop doesn't look them up per rule
+            append_disabled = stats["disabled_rules_details"].append
+            append_ignored = stats["ignored_rules_details"].append
+            # Live runs only disable queued rules when a bulk batch is flushed, so the
+            # progress bar also shows how many are waiting (str.format ignores the extra
+            # argument in dry runs)
+            progress_suffix = ("({} rules disabled)" if self.dry_run
+                               else "({} rules disabled, {} queued)").format
             
             # Track consecutive retries across all rules
             consecutive_retries = 0
             max_consecutive_retries = 10  # Maximum number of consecutive retries allowed
             
             for rule_id in zero_hit_rule_ids:
-                # Stop processing if we've reached the maximum number of rules to process
-                if processed_count >= total_to_process:
-                    logging.info(f"Reached maximum rule processing limit: {total_to_process}")
-                    break
-                
                 # Exit if too many consecutive retries
                 if consecutive_retries >= max_consecutive_retries:
                     logging.error(f"Reached maximum consecutive retries limit: {max_consecutive_retries}. Stopping processing.")
@@ -682,85 +1685,90 @@ class FMCRuleManager:
                 
                 # Update progress bar
                 processed_count += 1
+                progress = progress_suffix(disabled_count, len(pending_disables))
                 print_progress_bar(processed_count, total_to_process, prefix='Progress:', 
-                                  suffix=f'({disabled_count} rules disabled)', length=50)
+                                  suffix=progress, length=50)
                 
-                # Get detailed rule information with connection retry
+                # Use the concurrently fetched rule if available, otherwise get detailed
+                # rule information with connection retry
                 # HTTP 429 is handled by fmcapi internally
                 # But connection timeouts need manual retry with progressive backoff
-                retry_delays = [60, 90, 120, 240]  # Progressive backoff delays
-                max_retries = len(retry_delays)
+                # Exponential backoff with jitter between attempts
+                max_retries = RULE_FETCH_MAX_RETRIES
                 retry_occurred = False
-                for attempt in range(max_retries):
-                    try:
-                        access_rule = fmcapi.AccessRules(
-                            fmc=fmc_client, 
-                            acp_id=acp_id, 
-                            id=rule_id
-                        )
-                        rule_data = access_rule.get()
-                        # Success - reset consecutive retries counter
-                        consecutive_retries = 0
-                        retry_occurred = False
-                        break  # Success
-                    except requests.exceptions.ConnectTimeout:
-                        # Mark that a retry was needed
-                        retry_occurred = True
-                        consecutive_retries += 1
+                if rule_id in rules_by_id:
+                    rule_data = rules_by_id.pop(rule_id)
+                    consecutive_retries = 0
+                else:
+                    for attempt in range(max_retries):
+                        try:
+                            rule_data = self._get_rule(fmc_client, acp_id, rule_id)
+                            # Success - reset consecutive retries counter
+                            consecutive_retries = 0
+                            retry_occurred = False
+                            break  # Success
+                        except requests.exceptions.ConnectTimeout:
+                            # Mark that a retry was needed
+                            retry_occurred = True
+                            consecutive_retries += 1
                         
-                        if attempt < max_retries - 1:  # Don't sleep on last attempt
-                            delay = retry_delays[attempt]
-                            # Log details to file
-                            logging.warning(f"Connection timeout for rule ID {rule_id}. Retrying in {delay}s (attempt {attempt+1}/{max_retries}, consecutive: {consecutive_retries}/{max_consecutive_retries})...")
+                            if attempt < max_retries - 1:  # Don't sleep on last attempt
+                                delay = _backoff_delay(attempt)
+                                # Log details to file
+                                logging.warning(
+                                    "Connection timeout for rule ID %s. Retrying in %.1fs "
+                                    "(attempt %d/%d, consecutive: %d/%d)...",
+                                    rule_id, delay, attempt + 1, max_retries,
+                                    consecutive_retries, max_consecutive_retries)
                             
-                            retry_num = attempt + 1
+                                retry_num = attempt + 1
                             
-                            # Countdown timer integrated with progress bar
-                            for remaining in range(delay, 0, -1):
-                                # Show the progress bar with retry information
-                                retry_info = f"Retry #{retry_num}/{max_retries} - {remaining}s remaining (consecutive: {consecutive_retries}/{max_consecutive_retries})"
+                                # Show the retry wait once on the progress bar, then sleep in one go
+                                retry_info = (f"Retry #{retry_num}/{max_retries} in {delay:.0f}s "
+                                              f"(consecutive: {consecutive_retries}/"
+                                              f"{max_consecutive_retries})")
                                 print_progress_bar(
                                     processed_count, 
                                     total_to_process, 
                                     prefix='Progress:', 
-                                    suffix=f'({disabled_count} rules) | {retry_info}', 
-                                    length=50
+                                    suffix=f'{progress} | {retry_info}',
+                                    length=50,
+                                    force=True
                                 )
-                                time.sleep(1)
-                            
-                            # After countdown, restore the regular progress bar
-                            print_progress_bar(processed_count, total_to_process, prefix='Progress:', 
-                                             suffix=f'({disabled_count} rules disabled)', length=50)
-                        continue
+                                # The next progress update replaces the retry status
+                                time.sleep(delay)
+                            continue
                 
                 # If retries were exhausted but we want to continue with next rule
                 if retry_occurred and attempt == max_retries - 1:
-                    logging.warning(f"All retries exhausted for rule ID {rule_id}. Skipping this rule and continuing with next.")
+                    logging.warning("All retries exhausted for rule ID %s. Skipping this rule "
+                                    "and continuing with next.", rule_id)
                     stats["skipped_rules"] += 1
                     # Update progress bar to show we're continuing despite retries
                     print_progress_bar(processed_count, total_to_process, prefix='Progress:', 
-                                      suffix=f'({disabled_count} rules, {stats["skipped_rules"]} skipped) | Rule skipped after max retries', length=50)
+                                      suffix=f'{progress}, {stats["skipped_rules"]} skipped | '
+                                             f'Rule skipped after max retries',
+                                      length=50, force=True)
                     time.sleep(2)  # Brief pause to show message
                     continue  # Skip to next rule
                         
                 # Check if API call failed (returns None on auth failure)
                 if rule_data is None:
-                    logging.error(f"Failed to fetch rule {rule_id} - API returned None (possible authentication failure)")
+                    logging.error("Failed to fetch rule %s - API returned None "
+                                  "(possible authentication failure)", rule_id)
                     logging.error("Exiting to prevent further errors.")
                     break  # Exit the loop, don't continue processing
                 
-                rule_name = rule_data.get("name", "Unknown")
+                features = self._extract_features(rule_data)
+                rule_name = features.name
                 
-                # Extract first comment if available (needed for both disabled and ignored rules)
-                first_comment = ""
-                if "commentHistoryList" in rule_data and rule_data["commentHistoryList"]:
-                    first_comment_data = rule_data["commentHistoryList"][0]
-                    first_comment = first_comment_data.get("comment", "")
-                    first_comment_date = first_comment_data.get("date", "")
-                    if first_comment and first_comment_date:
-                        first_comment = f"{first_comment} ({first_comment_date})"
+                # Format first comment if available (needed for both disabled and ignored rules)
+                first_comment = features.first_comment_text
+                if first_comment and features.first_comment_date:
+                    first_comment = f"{first_comment} ({features.first_comment_date})"
                 
-                should_disable, reason = self._should_disable_rule(rule_data, current_time, fmc_client)
+                should_disable, reason = self._should_disable_rule(features, current_time,
+                                                                   fmc_client)
                 
                 if should_disable:
                     # Store rule details for summary
@@ -772,52 +1780,25 @@ class FMCRuleManager:
                     }
                     
                     if self.dry_run:
-                        logging.info(f"[DRY RUN] Would disable rule '{rule_name}' - {reason}")
-                        stats["rules_disabled"] += 1
-                        stats["disabled_rules_details"].append(rule_details)
+                        logging.info("[DRY RUN] Would disable rule '%s' - %s", rule_name, reason)
+                        disabled_count += 1
+                        append_disabled(rule_details)
                     else:
-                        # Disable the rule and add comment with retry logic
+                        # Queue the disabled rule with its comment for the next bulk update
+                        access_rule = fmcapi.AccessRules(fmc=fmc_client, acp_id=acp_id, id=rule_id)
+                        access_rule.parse_kwargs(**rule_data)
                         access_rule.enabled = False
-                        comment = f"DisabledByHitCountScript {current_time} - {reason}"
+                        comment = f"{_SCRIPT_TAG} {current_time} - {reason}"
                         access_rule.new_comments(action="add", value=comment)
+                        pending_disables.append((rule_details, access_rule.format_data()))
                         
-                        # Retry the post operation if it times out
-                        post_retry_delays = [10, 20, 30]
-                        post_max_retries = len(post_retry_delays)
-                        post_success = False
-                        
-                        for post_attempt in range(post_max_retries):
-                            try:
-                                access_rule.post()
-                                post_success = True
-                                break  # Success
-                            except (requests.exceptions.ReadTimeout, requests.exceptions.ConnectTimeout) as e:
-                                if post_attempt < post_max_retries - 1:
-                                    delay = post_retry_delays[post_attempt]
-                                    logging.warning(f"Timeout disabling rule '{rule_name}'. Retrying in {delay}s (attempt {post_attempt+1}/{post_max_retries})...")
-                                    print(f"\nTimeout disabling rule. Retrying in {delay}s...")
-                                    time.sleep(delay)
-                                else:
-                                    logging.error(f"Failed to disable rule '{rule_name}' after {post_max_retries} attempts: {str(e)}")
-                                    print(f"\nFailed to disable rule '{rule_name}' after {post_max_retries} attempts")
-                                    stats["skipped_rules"] += 1
-                        
-                        if post_success:
-                            # Full details in log file, minimal console output
-                            logging.info(f"Disabled rule '{rule_name}' - {reason}")
-                            stats["rules_disabled"] += 1
-                            stats["disabled_rules_details"].append(rule_details)
-                            disabled_count += 1
-                        else:
-                            # Failed to disable after retries - don't count as disabled
-                            logging.warning(f"Skipping rule '{rule_name}' due to persistent timeout errors")
-                    
-                    if self.dry_run:
-                        disabled_count += 1
+                        if len(pending_disables) >= BULK_DISABLE_CHUNK_SIZE:
+                            disabled_count += self._flush_disabled_rules(
+                                fmc_client, rules_url, pending_disables, stats)
                 else:
                     # Log skip reason but don't clutter console
-                    logging.debug(f"Skipped rule '{rule_name}' - {reason}")
-                    stats["rules_skipped"] += 1
+                    logging.debug("Skipped rule '%s' - %s", rule_name, reason)
+                    ignored_count += 1
                     
                     # Store details of ignored rules (zero hits but not disabled)
                     ignored_rule_details = {
@@ -827,7 +1808,16 @@ class FMCRuleManager:
                         "ignore_reason": reason,
                         "ignore_detail": self._get_ignore_detail(rule_data, reason)
                     }
-                    stats["ignored_rules_details"].append(ignored_rule_details)
+                    append_ignored(ignored_rule_details)
+            
+            # Disable any rules still queued for a bulk update
+            disabled_count += self._flush_disabled_rules(fmc_client, rules_url,
+                                                         pending_disables, stats)
+            
+            stats["rules_skipped"] = ignored_count
+            if self.dry_run:
+                # Live runs count disabled rules in _flush_disabled_rules as FMC confirms them
+                stats["rules_disabled"] = disabled_count
             
             logging.info("Hit count analysis completed")
             
@@ -856,100 +1846,73 @@ def export_to_excel(stats: Dict, device_name: str, excel_file: str, dry_run: boo
         excel_file: Path to the Excel file to create
         dry_run: Whether this was a dry run
     """
-    if not EXCEL_AVAILABLE:
+    if _try_import_openpyxl() is None:
         logging.error("openpyxl is not installed. Cannot create Excel report.")
         logging.error("Install it with: pip install openpyxl")
         return
     
     try:
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font, Alignment, PatternFill
-        from openpyxl.utils import get_column_letter
         
-        # Create workbook
-        wb = Workbook()
+        # Write-only workbook: rows are streamed to the file as they are appended, so
+        # column widths and frozen panes are set before any rows are written
+        wb = Workbook(write_only=True)
         
-        # === Sheet 1: Operation Summary ===
-        ws_summary = wb.active
-        ws_summary.title = "Operation Summary"
+        def styled(ws, value, font=None, fill=None, alignment=None):
+            cell = WriteOnlyCell(ws, value=value)
+            if font:
+                cell.font = font
+            if fill:
+                cell.fill = fill
+            if alignment:
+                cell.alignment = alignment
+            return cell
         
-        # Header
-        ws_summary['A1'] = "FMC Hit Count Analysis - Operation Summary"
-        ws_summary['A1'].font = Font(bold=True, size=14)
-        ws_summary['A1'].fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        ws_summary['A1'].font = Font(bold=True, size=14, color="FFFFFF")
+        bold = Font(bold=True)
+        wrap = Alignment(wrap_text=True)
+        header_font = Font(bold=True, color="FFFFFF")
+        header_alignment = Alignment(horizontal="center", vertical="center")
         
-        # Summary data
-        row = 3
-        ws_summary[f'A{row}'] = "Device Name:"
-        ws_summary[f'B{row}'] = device_name
-        ws_summary[f'A{row}'].font = Font(bold=True)
-        
-        row += 1
-        ws_summary[f'A{row}'] = "Analysis Date:"
-        ws_summary[f'B{row}'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        ws_summary[f'A{row}'].font = Font(bold=True)
-        
-        row += 1
-        ws_summary[f'A{row}'] = "Mode:"
-        ws_summary[f'B{row}'] = "DRY RUN (No changes made)" if dry_run else "LIVE EXECUTION"
-        ws_summary[f'A{row}'].font = Font(bold=True)
-        if dry_run:
-            ws_summary[f'B{row}'].font = Font(color="FF0000", bold=True)
-        
-        row += 2
-        ws_summary[f'A{row}'] = "Statistics"
-        ws_summary[f'A{row}'].font = Font(bold=True, size=12)
-        
-        row += 1
-        ws_summary[f'A{row}'] = "Total Rules Analyzed:"
-        ws_summary[f'B{row}'] = stats['total_rules_analyzed']
-        ws_summary[f'A{row}'].font = Font(bold=True)
-        
-        row += 1
-        ws_summary[f'A{row}'] = "Rules with Zero Hits:"
-        ws_summary[f'B{row}'] = stats['zero_hit_rules']
-        ws_summary[f'A{row}'].font = Font(bold=True)
-        
-        row += 1
-        ws_summary[f'A{row}'] = "Rules Disabled:"
-        ws_summary[f'B{row}'] = stats['rules_disabled']
-        ws_summary[f'A{row}'].font = Font(bold=True)
-        ws_summary[f'B{row}'].font = Font(color="00B050", bold=True)
-        
-        row += 1
-        ws_summary[f'A{row}'] = "Rules Skipped/Ignored:"
-        ws_summary[f'B{row}'] = stats['rules_skipped']
-        ws_summary[f'A{row}'].font = Font(bold=True)
-        ws_summary[f'B{row}'].font = Font(color="FF9900", bold=True)
+        # === Sheet 1: Operation Summary ===
+        ws_summary = wb.create_sheet("Operation Summary")
         
         # Adjust column widths
         ws_summary.column_dimensions['A'].width = 30
         ws_summary.column_dimensions['B'].width = 50
         
+        # Header
+        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+        ws_summary.append([styled(ws_summary, "FMC Hit Count Analysis - Operation Summary",
+                                  font=Font(bold=True, size=14, color="FFFFFF"),
+                                  fill=header_fill)])
+        ws_summary.append([])
+        
+        # Summary data
+        ws_summary.append([styled(ws_summary, "Device Name:", font=bold), device_name])
+        ws_summary.append([styled(ws_summary, "Analysis Date:", font=bold),
+                           datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
+        ws_summary.append([styled(ws_summary, "Mode:", font=bold),
+                           styled(ws_summary, "DRY RUN (No changes made)",
+                                  font=Font(color="FF0000", bold=True))
+                           if dry_run else "LIVE EXECUTION"])
+        ws_summary.append([])
+        ws_summary.append([styled(ws_summary, "Statistics", font=Font(bold=True, size=12))])
+        ws_summary.append([styled(ws_summary, "Total Rules Analyzed:", font=bold),
+                           stats['total_rules_analyzed']])
+        ws_summary.append([styled(ws_summary, "Rules with Zero Hits:", font=bold),
+                           stats['zero_hit_rules']])
+        ws_summary.append([styled(ws_summary, "Rules Disabled:", font=bold),
+                           styled(ws_summary, stats['rules_disabled'],
+                                  font=Font(color="00B050", bold=True))])
+        ws_summary.append([styled(ws_summary, "Rules Skipped/Ignored:", font=bold),
+                           styled(ws_summary, stats['rules_skipped'],
+                                  font=Font(color="FF9900", bold=True))])
+        
         # === Sheet 2: Disabled Rules ===
         ws_disabled = wb.create_sheet("Disabled Rules")
         
-        # Headers
-        headers = ["Rule Name", "Rule ID", "First Comment", "Disable Reason"]
-        for col_num, header in enumerate(headers, 1):
-            cell = ws_disabled.cell(row=1, column=col_num)
-            cell.value = header
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-        
-        # Data
-        for row_num, rule in enumerate(stats.get('disabled_rules_details', []), 2):
-            ws_disabled.cell(row=row_num, column=1, value=rule['name'])
-            ws_disabled.cell(row=row_num, column=2, value=rule['id'])
-            ws_disabled.cell(row=row_num, column=3, value=rule['first_comment'])
-            ws_disabled.cell(row=row_num, column=4, value=rule['reason'])
-            
-            # Wrap text for long comments
-            ws_disabled.cell(row=row_num, column=3).alignment = Alignment(wrap_text=True)
-            ws_disabled.cell(row=row_num, column=4).alignment = Alignment(wrap_text=True)
-        
         # Adjust column widths
         ws_disabled.column_dimensions['A'].width = 25
         ws_disabled.column_dimensions['B'].width = 38
@@ -959,30 +1922,24 @@ def export_to_excel(stats: Dict, device_name: str, excel_file: str, dry_run: boo
         # Freeze header row
         ws_disabled.freeze_panes = 'A2'
         
+        # Headers
+        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+        headers = ["Rule Name", "Rule ID", "First Comment", "Disable Reason"]
+        ws_disabled.append([styled(ws_disabled, header, font=header_font, fill=header_fill,
+                                   alignment=header_alignment) for header in headers])
+        
+        # Data, wrapping text for long comments
+        for rule in stats.get('disabled_rules_details', []):
+            ws_disabled.append([
+                rule['name'],
+                rule['id'],
+                styled(ws_disabled, rule['first_comment'], alignment=wrap),
+                styled(ws_disabled, rule['reason'], alignment=wrap),
+            ])
+        
         # === Sheet 3: Ignored Rules ===
         ws_ignored = wb.create_sheet("Ignored Rules")
         
-        # Headers
-        headers = ["Rule Name", "Rule ID", "First Comment", "Ignore Reason", "Ignore Detail"]
-        for col_num, header in enumerate(headers, 1):
-            cell = ws_ignored.cell(row=1, column=col_num)
-            cell.value = header
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="FF9900", end_color="FF9900", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-        
-        # Data
-        for row_num, rule in enumerate(stats.get('ignored_rules_details', []), 2):
-            ws_ignored.cell(row=row_num, column=1, value=rule['name'])
-            ws_ignored.cell(row=row_num, column=2, value=rule['id'])
-            ws_ignored.cell(row=row_num, column=3, value=rule['first_comment'])
-            ws_ignored.cell(row=row_num, column=4, value=rule['ignore_reason'])
-            ws_ignored.cell(row=row_num, column=5, value=rule['ignore_detail'])
-            
-            # Wrap text for long comments
-            for col in [3, 4, 5]:
-                ws_ignored.cell(row=row_num, column=col).alignment = Alignment(wrap_text=True)
-        
         # Adjust column widths
         ws_ignored.column_dimensions['A'].width = 25
         ws_ignored.column_dimensions['B'].width = 38
@@ -993,6 +1950,22 @@ def export_to_excel(stats: Dict, device_name: str, excel_file: str, dry_run: boo
         # Freeze header row
         ws_ignored.freeze_panes = 'A2'
         
+        # Headers
+        header_fill = PatternFill(start_color="FF9900", end_color="FF9900", fill_type="solid")
+        headers = ["Rule Name", "Rule ID", "First Comment", "Ignore Reason", "Ignore Detail"]
+        ws_ignored.append([styled(ws_ignored, header, font=header_font, fill=header_fill,
+                                  alignment=header_alignment) for header in headers])
+        
+        # Data, wrapping text for long comments
+        for rule in stats.get('ignored_rules_details', []):
+            ws_ignored.append([
+                rule['name'],
+                rule['id'],
+                styled(ws_ignored, rule['first_comment'], alignment=wrap),
+                styled(ws_ignored, rule['ignore_reason'], alignment=wrap),
+                styled(ws_ignored, rule['ignore_detail'], alignment=wrap),
+            ])
+        
         # Save workbook
         wb.save(excel_file)
         logging.info(f"Excel report saved to: {excel_file}")
@@ -1003,53 +1976,62 @@ def export_to_excel(stats: Dict, device_name: str, excel_file: str, dry_run: boo
         print(f"Error creating Excel report: {str(e)}")
 
 
-def format_disabled_rules_table(disabled_rules: List[Dict]) -> str:
+def export_to_csv(stats: Dict, device_name: str, csv_file: str, dry_run: bool = False) -> None:
     """
-    Format disabled rules data into a readable table.
+    Export operation statistics to CSV files, one per Excel report sheet.
+    
+    The given path is used as a base name: report.csv produces report_summary.csv,
+    report_disabled.csv and report_ignored.csv.
     
     Args:
-        disabled_rules: List of disabled rule dictionaries
-        
-    Returns:
-        Formatted table string
+        stats: Dictionary containing operation statistics
+        device_name: Name of the device analyzed
+        csv_file: Base path of the CSV files to create
+        dry_run: Whether this was a dry run
     """
-    if not disabled_rules:
-        return "No rules were disabled."
+    base, ext = os.path.splitext(csv_file)
+    ext = ext or ".csv"
+    sheets = {
+        "summary": (
+            ["Field", "Value"],
+            [
+                ("Device Name", device_name),
+                ("Analysis Date", datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                ("Mode", "DRY RUN (No changes made)" if dry_run else "LIVE EXECUTION"),
+                ("Total Rules Analyzed", stats['total_rules_analyzed']),
+                ("Rules with Zero Hits", stats['zero_hit_rules']),
+                ("Rules Disabled", stats['rules_disabled']),
+                ("Rules Skipped/Ignored", stats['rules_skipped']),
+            ],
+        ),
+        "disabled": (
+            ["Rule Name", "Rule ID", "First Comment", "Disable Reason"],
+            ((rule['name'], rule['id'], rule['first_comment'], rule['reason'])
+             for rule in stats.get('disabled_rules_details', [])),
+        ),
+        "ignored": (
+            ["Rule Name", "Rule ID", "First Comment", "Ignore Reason", "Ignore Detail"],
+            ((rule['name'], rule['id'], rule['first_comment'], rule['ignore_reason'],
+              rule['ignore_detail'])
+             for rule in stats.get('ignored_rules_details', [])),
+        ),
+    }
     
-    # Calculate column widths
-    name_width = max(len("Rule Name"), max(len(rule["name"]) for rule in disabled_rules))
-    id_width = len("ECF40C21-3F6A-0ed3-0000-000268479583")  # Fixed width for rule IDs
-    comment_width = max(len("First Comment"), max(len(rule["first_comment"]) for rule in disabled_rules))
-    reason_width = max(len("Disable Reason"), max(len(rule["reason"]) for rule in disabled_rules))
-    
-    # Limit column widths for readability
-    name_width = min(name_width, 35)
-    comment_width = min(comment_width, 55)
-    reason_width = min(reason_width, 45)
-    
-    # Create table format
-    separator = "+" + "-" * (name_width + 2) + "+" + "-" * (id_width + 2) + "+" + "-" * (comment_width + 2) + "+" + "-" * (reason_width + 2) + "+"
-    header_format = f"| {{:<{name_width}}} | {{:<{id_width}}} | {{:<{comment_width}}} | {{:<{reason_width}}} |"
-    row_format = f"| {{:<{name_width}.{name_width}}} | {{:<{id_width}}} | {{:<{comment_width}.{comment_width}}} | {{:<{reason_width}.{reason_width}}} |"
-    
-    # Build table
-    lines = [
-        separator,
-        header_format.format("Rule Name", "Rule ID", "First Comment", "Disable Reason"),
-        separator
-    ]
-    
-    for rule in disabled_rules:
-        lines.append(row_format.format(
-            rule["name"],
-            rule["id"], 
-            rule["first_comment"],
-            rule["reason"]
-        ))
-    
-    lines.append(separator)
-    
-    return "\n".join(lines)
+    try:
+        paths = []
+        for sheet, (headers, rows) in sheets.items():
+            path = f"{base}_{sheet}{ext}"
+            with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(headers)
+                writer.writerows(rows)
+            logging.info(f"CSV report saved to: {path}")
+            paths.append(path)
+        print(f"\nCSV report saved to: {', '.join(paths)}")
+        
+    except OSError as e:
+        logging.error(f"Error creating CSV report: {str(e)}")
+        print(f"Error creating CSV report: {str(e)}")
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -1120,6 +2102,13 @@ Examples:
         default=10,
         help='API timeout in seconds (default: 10)'
     )
+    parser.add_argument(
+        '--rate-limit',
+        type=float,
+        default=DEFAULT_API_RATE_LIMIT,
+        help=f'Maximum object/rule API calls per second, 0 to disable '
+             f'(default: {DEFAULT_API_RATE_LIMIT})'
+    )
     parser.add_argument(
         '--log-file',
         help='Log file name (default: log to console only)'
@@ -1172,8 +2161,35 @@ Examples:
         '--excel-report',
         help='Generate an Excel report file with operation summary, disabled rules, and ignored rules (e.g., report.xlsx). Requires openpyxl package.'
     )
+    parser.add_argument(
+        '--csv-report',
+        help='Generate CSV reports with operation summary, disabled rules, and ignored rules, '
+             'using the given path as base name (e.g., report.csv creates report_summary.csv, '
+             'report_disabled.csv and report_ignored.csv). No extra packages required.'
+    )
+    parser.add_argument(
+        '--cache-file',
+        help='JSON file used to persist resolved network objects across runs, keyed by FMC '
+             'host (e.g., ~/.fmc_rule_cleanup_cache.json). Disabled by default.'
+    )
+    parser.add_argument(
+        '--refresh-cache',
+        action='store_true',
+        default=False,
+        help='Ignore the existing contents of --cache-file and rebuild it (default: False)'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=DEFAULT_CACHE_TTL_HOURS,
+        help=f'Hours after which --cache-file entries are fetched from FMC again '
+             f'(default: {DEFAULT_CACHE_TTL_HOURS})'
+    )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.refresh_cache and not args.cache_file:
+        parser.error("--refresh-cache requires --cache-file")
+    return args
 
 
 def main() -> int:
@@ -1197,7 +2213,11 @@ def main() -> int:
         year_threshold=args.year_threshold,
         rule_actions=args.rule_actions,
         exclude_prefixes=args.exclude_prefixes,
-        prefix_match_mode=args.prefix_match_mode
+        prefix_match_mode=args.prefix_match_mode,
+        cache_file=args.cache_file,
+        refresh_cache=args.refresh_cache,
+        api_rate_limit=args.rate_limit,
+        cache_ttl_hours=args.cache_ttl
     )
     
     # Run the analysis - let any exceptions propagate (matches simple script)
@@ -1221,6 +2241,10 @@ def main() -> int:
     if args.excel_report:
         export_to_excel(stats, args.device_name, args.excel_report, args.dry_run)
     
+    # Generate CSV report if requested
+    if args.csv_report:
+        export_to_csv(stats, args.device_name, args.csv_report, args.dry_run)
+    
     return 0
 
 
@@ -45,6 +45,7 @@ CMD="$CMD --device \"$DEVICE_NAME\""
 [ -n "$MAX_RULES" ] && CMD="$CMD --max-rules $MAX_RULES"
 [ -n "$PAGE_LIMIT" ] && CMD="$CMD --page-limit $PAGE_LIMIT"
 [ -n "$TIMEOUT" ] && CMD="$CMD --timeout $TIMEOUT"
+[ -n "$RATE_LIMIT" ] && CMD="$CMD --rate-limit $RATE_LIMIT"
 [ -n "$LOG_FILE" ] && CMD="$CMD --log-file \"$LOG_FILE\""
 [ -n "$EXCLUDE_ZONES" ] && CMD="$CMD --exclude-zones $EXCLUDE_ZONES"
 [ -n "$EXCLUDE_PREFIXES" ] && CMD="$CMD --exclude-prefixes $EXCLUDE_PREFIXES"
@@ -52,6 +53,9 @@ CMD="$CMD --device \"$DEVICE_NAME\""
 [ -n "$YEAR_THRESHOLD" ] && CMD="$CMD --year-threshold $YEAR_THRESHOLD"
 [ -n "$RULE_ACTIONS" ] && CMD="$CMD --rule-actions $RULE_ACTIONS"
 [ -n "$EXCEL_REPORT" ] && CMD="$CMD --excel-report \"$EXCEL_REPORT\""
+[ -n "$CSV_REPORT" ] && CMD="$CMD --csv-report \"$CSV_REPORT\""
+[ -n "$CACHE_FILE" ] && CMD="$CMD --cache-file \"$CACHE_FILE\""
+[ -n "$CACHE_TTL" ] && CMD="$CMD --cache-ttl $CACHE_TTL"
 [ "$DEBUG" = "true" ] && CMD="$CMD --debug"
 [ "$AUTODEPLOY" = "true" ] && CMD="$CMD --autodeploy"
 